@@ -232,4 +232,9 @@ def two_theta(
     # operations'.
     b1 = incident_beam / L1(incident_beam=incident_beam)
     b2 = scattered_beam / L2(scattered_beam=scattered_beam)
-    return 2 * sc.atan2(y=sc.norm(b1 - b2), x=sc.norm(b1 + b2))
+    y = sc.norm(b1 - b2)
+    x = sc.norm(b1 + b2)
+    # Write the result into the buffer of y to avoid allocating another array.
+    res = sc.atan2(y=y, x=x, out=y)
+    res *= 2
+    return res
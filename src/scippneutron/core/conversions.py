@@ -2,7 +2,9 @@
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 # @author Jan-Lukas Wynen
 
-from typing import Callable, Dict, Tuple, Union
+import functools
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Tuple, Union
 
 import scipp as sc
 
@@ -20,17 +22,21 @@ def _inelastic_scatter_graph(energy_mode):
     }
 
 
-def _reachable_by(target, graph):
-    return any(
-        target == targets if isinstance(targets, str) else target in targets
+def _targets_of(graph):
+    return frozenset(
+        target
         for targets in graph.keys()
+        for target in ((targets,) if isinstance(targets, str) else targets)
     )
 
 
+_SCATTER_KINEMATIC_TARGETS = _targets_of(_graphs.beamline.beamline(scatter=True))
+
+
 def _elastic_scatter_graph(origin, target):
     scatter_graph_kinematics = _graphs.beamline.beamline(scatter=True)
-    if _reachable_by(target, scatter_graph_kinematics):
-        return dict(scatter_graph_kinematics)
+    if target in _SCATTER_KINEMATIC_TARGETS:
+        return scatter_graph_kinematics
     return {**scatter_graph_kinematics, **_graphs.tof.elastic(origin)}
 
 
@@ -61,14 +67,22 @@ def conversion_graph(
               :py:func:`scippneutron.deduce_conversion_graph`.
     """
 
-    # Results are copied to ensure users do not modify the global dictionaries.
+    # Results are copied to ensure users do not modify the cached graphs.
+    return dict(_cached_conversion_graph(origin, target, scatter, energy_mode))
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_conversion_graph(
+    origin: str, target: str, scatter: bool, energy_mode: str
+) -> Mapping[Union[str, Tuple[str]], Callable]:
     if scatter:
-        return dict(_scatter_graph(origin, target, energy_mode))
+        graph = _scatter_graph(origin, target, energy_mode)
     else:
-        return {
+        graph = {
             **_graphs.beamline.beamline(scatter=False),
             **_graphs.tof.kinematic(start='tof'),
         }
+    return MappingProxyType(graph)
 
 
 def _find_inelastic_inputs(data):
@@ -118,7 +132,14 @@ def deduce_conversion_graph(
     :return: Conversion graph.
     :seealso: :py:func:`scippneutron.convert`, :py:func:`scippneutron.conversion_graph`.
     """
-    return conversion_graph(
+    # Results are copied to ensure users do not modify the cached graphs.
+    return dict(_deduce_cached_graph(data, origin, target, scatter))
+
+
+def _deduce_cached_graph(
+    data: Union[sc.DataArray, sc.Dataset], origin: str, target: str, scatter: bool
+) -> Mapping[Union[str, Tuple[str]], Callable]:
+    return _cached_conversion_graph(
         origin, target, scatter, _deduce_energy_mode(data, origin, target)
     )
 
@@ -142,7 +163,8 @@ def convert(
               the possible conversions.
     """
 
-    graph = deduce_conversion_graph(data, origin, target, scatter)
+    # Use the cached graph directly, transform_coords does not modify it.
+    graph = _deduce_cached_graph(data, origin, target, scatter)
 
     try:
         converted = data.transform_coords(target, graph=graph)
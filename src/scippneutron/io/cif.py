@@ -62,6 +62,7 @@ This results in a file containing
 from __future__ import annotations
 
 import io
+import re
 import warnings
 from contextlib import contextmanager
 from dataclasses import dataclass
@@ -108,9 +109,13 @@ def save_cif(
     """
     if isinstance(blocks, Block):
         blocks = (blocks,)
+    # Assemble the whole file in memory and write it in one go
+    # instead of issuing many small writes to the output file.
+    buffer = io.StringIO()
+    _write_file_heading(buffer)
+    _write_multi(buffer, blocks)
     with _open(fname) as f:
-        _write_file_heading(f)
-        _write_multi(f, blocks)
+        f.write(buffer.getvalue())
 
 
 class Chunk:
@@ -266,19 +271,22 @@ class Loop:
         f.write('loop_\n')
         for key in self._columns:
             f.write(f'_{key}\n')
-        formatted_values = [
-            tuple(map(_format_value, row)) for row in zip(*self._columns.values())
+        formatted_columns = [
+            _format_column(column) for column in self._columns.values()
         ]
         # If any value is a multi-line string, lay out elements as a flat vertical
         # list, otherwise use a 2d table.
+        # Multi-line strings are formatted as '; ...\n;', so checking the first
+        # character is enough.
         sep = (
             '\n'
-            if any(';' in item for row in formatted_values for item in row)
+            if any(
+                item.startswith(';') for column in formatted_columns for item in column
+            )
             else ' '
         )
-        for row in formatted_values:
-            f.write(sep.join(row))
-            f.write('\n')
+        formatted_values = zip(*formatted_columns)
+        f.write(''.join(sep.join(row) + '\n' for row in formatted_values))
 
 
 class Block:
@@ -527,7 +535,13 @@ def _make_schema_loop(schema: set[CIFSchema]) -> Optional[Loop]:
     )
 
 
+_CHARS_REQUIRING_QUOTES = re.compile('[\n\'" ]')
+
+
 def _quotes_for_string_value(value: str) -> Optional[str]:
+    # Most values need no quotes, detect that with a single scan.
+    if _CHARS_REQUIRING_QUOTES.search(value) is None:
+        return None
     if '\n' in value:
         return ';'
     if "'" in value:
@@ -542,6 +556,8 @@ def _quotes_for_string_value(value: str) -> Optional[str]:
 
 
 def _encode_non_ascii(s: str) -> str:
+    if s.isascii():
+        return s
     return s.encode('ascii', 'backslashreplace').decode('ascii')
 
 
@@ -556,7 +572,10 @@ def _format_value(value: Any) -> str:
         s = value.isoformat()
     else:
         s = str(value)
+    return _format_string(s)
+
 
+def _format_string(s: str) -> str:
     s = _encode_non_ascii(s)
 
     if (quotes := _quotes_for_string_value(s)) == ';':
@@ -566,6 +585,25 @@ def _format_value(value: Any) -> str:
     return s
 
 
+_PLAIN_NUMBER_DTYPES = (
+    sc.DType.float64,
+    sc.DType.float32,
+    sc.DType.int64,
+    sc.DType.int32,
+)
+
+
+def _format_column(column: sc.Variable) -> list[str]:
+    if column.variances is None and column.dtype in _PLAIN_NUMBER_DTYPES:
+        # Plain numbers never need quotes or escaping and NumPy produces
+        # the same strings as _format_value.
+        return column.values.astype(str).tolist()
+    if column.variances is None and column.dtype == sc.DType.string:
+        # Avoid creating a scalar variable per element.
+        return [_format_string(value) for value in column.values]
+    return [_format_value(value) for value in column]
+
+
 def _write_comment(f: io.TextIOBase, comment: str) -> None:
     if comment:
         f.write('# ')
@@ -302,9 +302,12 @@ def _load_data(
                 events.coords['pulse_time'] = events.coords.pop('event_time_zero')
                 events.bins.coords['tof'] = events.bins.coords.pop('event_time_offset')
                 events.bins.coords['detector_id'] = events.bins.coords.pop('event_id')
-                det_min = events.bins.coords['detector_id'].min().value
-                det_max = events.bins.coords['detector_id'].max().value
-                if len(events.bins.constituents['data']) != 0:
+                buffer = events.bins.constituents['data']
+                if len(buffer) != 0:
+                    # The buffer holds exactly the loaded events, so the
+                    # id range can be taken from the raw array directly.
+                    ids = buffer.coords['detector_id'].values
+                    det_min, det_max = int(ids.min()), int(ids.max())
                     # See scipp/scipp#2490
                     det_id = sc.arange('detector_id', det_min, det_max + 1, unit=None)
                     events = make_binned(
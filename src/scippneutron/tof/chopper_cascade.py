@@ -15,11 +15,13 @@ from typing import Any, List, Optional, Union
 import numpy as np
 import scipp as sc
 
+_INVERSE_VELOCITY_PER_WAVELENGTH = (sc.constants.m_n / sc.constants.h).to(
+    unit='s/m/angstrom'
+)
+
 
 def wavelength_to_inverse_velocity(wavelength):
-    h = sc.constants.h
-    m_n = sc.constants.m_n
-    return (wavelength * m_n / h).to(unit='s/m')
+    return (wavelength * _INVERSE_VELOCITY_PER_WAVELENGTH).to(unit='s/m', copy=False)
 
 
 def propagate_times(
@@ -192,13 +194,23 @@ class Frame:
 
     def bounds(self) -> sc.DataGroup:
         """The bounds of the frame, i.e., the global min and max time and wavelength."""
-        start = sc.reduce([sub.start_time for sub in self.subframes]).min()
-        end = sc.reduce([sub.end_time for sub in self.subframes]).max()
-        wav_start = sc.reduce([sub.start_wavelength for sub in self.subframes]).min()
-        wav_end = sc.reduce([sub.end_wavelength for sub in self.subframes]).max()
+        # All subframes use the same units, see Subframe.__init__.
+        time = np.concatenate([sub.time.values for sub in self.subframes])
+        wavelength = np.concatenate([sub.wavelength.values for sub in self.subframes])
+        first = self.subframes[0]
         return sc.DataGroup(
-            time=sc.concat([start, end], dim='bound'),
-            wavelength=sc.concat([wav_start, wav_end], dim='bound'),
+            time=sc.array(
+                dims=['bound'],
+                values=[time.min(), time.max()],
+                unit=first.time.unit,
+                dtype=first.time.dtype,
+            ),
+            wavelength=sc.array(
+                dims=['bound'],
+                values=[wavelength.min(), wavelength.max()],
+                unit=first.wavelength.unit,
+                dtype=first.wavelength.dtype,
+            ),
         )
 
     def subbounds(self) -> sc.DataGroup:
@@ -228,41 +240,26 @@ class Frame:
         wav_starts = [subframe.start_wavelength for subframe in self.subframes]
         wav_ends = [subframe.end_wavelength for subframe in self.subframes]
 
-        @dataclass
-        class Bound:
-            start: sc.Variable
-            end: sc.Variable
-            wav_start: sc.Variable
-            wav_end: sc.Variable
-
-        bounds = [
-            Bound(start, end, wav_start, wav_end)
-            for start, end, wav_start, wav_end in zip(
-                starts, ends, wav_starts, wav_ends
-            )
-        ]
-        bounds = sorted(bounds, key=lambda x: x.start)
-        current = bounds[0]
+        # Sort and compare plain values instead of scipp scalars.
+        # All subframes use the same units, see Subframe.__init__.
+        order = np.argsort([start.value for start in starts], kind='stable')
         merged_bounds = []
-        for bound in bounds[1:]:
+        for i in order:
             # If start is before current end, merge
-            if bound.start <= current.end:
-                current = Bound(
-                    current.start,
-                    max(current.end, bound.end),
-                    current.wav_start,
-                    max(current.wav_end, bound.wav_end),
-                )
+            if merged_bounds and starts[i].value <= merged_bounds[-1][1].value:
+                current = merged_bounds[-1]
+                if ends[i].value > current[1].value:
+                    current[1] = ends[i]
+                if wav_ends[i].value > current[3].value:
+                    current[3] = wav_ends[i]
             else:
-                merged_bounds.append(current)
-                current = bound
-        merged_bounds.append(current)
+                merged_bounds.append([starts[i], ends[i], wav_starts[i], wav_ends[i]])
         time_bounds = [
-            sc.concat([bound.start, bound.end], dim='bound') for bound in merged_bounds
+            sc.concat([start, end], dim='bound') for start, end, _, _ in merged_bounds
         ]
         wav_bounds = [
-            sc.concat([bound.wav_start, bound.wav_end], dim='bound')
-            for bound in merged_bounds
+            sc.concat([wav_start, wav_end], dim='bound')
+            for _, _, wav_start, wav_end in merged_bounds
         ]
         return sc.DataGroup(
             time=sc.concat(time_bounds, dim='subframe'),
@@ -508,22 +505,29 @@ class Chopper:
 def _chop(
     frame: Subframe, time: sc.Variable, close_to_open: bool
 ) -> Optional[Subframe]:
-    inside = frame.time >= time if close_to_open else frame.time <= time
-    output = []
-    for i in range(len(frame.time)):
-        # Note how j wraps around to 0
-        j = (i + 1) % len(frame.time)
-        inside_i = inside[i]
-        inside_j = inside[j]
-        if inside_i:
-            output.append((frame.time[i], frame.wavelength[i]))
-        if inside_i != inside_j:
-            # Intersection
-            t = (time - frame.time[i]) / (frame.time[j] - frame.time[i])
-            v = (1 - t) * frame.wavelength[i] + t * frame.wavelength[j]
-            output.append((time, v))
-    if not output:
+    # Clip the polygon against the line defined by `time` (Sutherland-Hodgman).
+    # Comparing in scipp ensures that units match, the rest works on plain arrays.
+    inside = (frame.time >= time if close_to_open else frame.time <= time).values
+    if not inside.any():
         return None
-    time = sc.concat([t for t, _ in output], dim=frame.time.dim)
-    wavelength = sc.concat([v for _, v in output], dim=frame.wavelength.dim)
-    return Subframe(time=time, wavelength=wavelength)
+    t = frame.time.values
+    w = frame.wavelength.values
+    # Edge i connects vertex i and vertex i + 1, wrapping around to 0.
+    t_next = np.roll(t, -1)
+    w_next = np.roll(w, -1)
+    crossing = inside != np.roll(inside, -1)
+    # Edges that do not cross the line may divide by zero, they are dropped below.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        frac = (time.value - t) / (t_next - t)
+        w_intersection = (1 - frac) * w + frac * w_next
+    # Each vertex that is inside is followed by the intersection of its outgoing
+    # edge with the line, if the edge crosses the line.
+    select = np.stack([inside, crossing], axis=1).ravel()
+    new_t = np.stack([t, np.full_like(t, time.value)], axis=1).ravel()[select]
+    new_w = np.stack([w, w_intersection], axis=1).ravel()[select]
+    return Subframe(
+        time=sc.array(dims=frame.time.dims, values=new_t, unit=frame.time.unit),
+        wavelength=sc.array(
+            dims=frame.wavelength.dims, values=new_w, unit=frame.wavelength.unit
+        ),
+    )
@@ -1,7 +1,9 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 # @author Simon Heybrock
+import numpy as np
 import scipp as sc
+from matplotlib.collections import PatchCollection
 from matplotlib.patches import Rectangle
 from scipp.constants import h, m_n
 
@@ -55,11 +57,11 @@ class TimeDistanceDiagram:
             va="top",
             fontsize=6,
         )
-        while t0 < self._tmax.value:
-            rect = Rectangle((t0, 0), t1, -1, lw=1, fc='orange', ec='k')
-            self._ax.add_patch(rect)
-            self._ax.axvline(x=t0, ls=ls)
-            t0 += self._frame_length.value
+        starts = np.arange(t0, self._tmax.value, self._frame_length.value)
+        pulses = [Rectangle((start, 0), t1, -1) for start in starts]
+        self._ax.add_collection(PatchCollection(pulses, lw=1, fc='orange', ec='k'))
+        # Draw all frame boundaries as a single artist spanning the full height.
+        self._ax.vlines(starts, 0, 1, transform=self._ax.get_xaxis_transform(), ls=ls)
 
     def add_neutron(
         self,
@@ -128,11 +130,11 @@ class TimeDistanceDiagram:
         t0 = time_offset
         tmin = t0 + tof_min
         tmax = t0 + tof_max
-        t = sc.concat([t0, t0, tmax, tmin], 't')
-        L = sc.concat([Lmin, Lmin, Lmax, Lmax], 'L')
+        t = np.array([t0.value, t0.value, tmax.value, tmin.value])
+        L = np.array([Lmin.value, Lmin.value, Lmax.value, Lmax.value])
         for _ in range(frames):
-            self._ax.fill(t.values, L.values, alpha=0.3)
-            t += stride * self._frame_length
+            self._ax.fill(t, L, alpha=0.3)
+            t += stride * self._frame_length.value
 
     def add_detector(self, *, distance, name='detector'):
         # TODO This could accept a list of positions and plot a rectangle from min to
@@ -3,7 +3,9 @@
 # @author Jan-Lukas Wynen
 
 import pytest
+import scipp as sc
 
+from scippneutron.conversion import beamline as beamline_conv
 from scippneutron.conversion.graph import beamline
 
 
@@ -76,3 +78,24 @@ def test_beamline_returns_new_graph_with_scatter_arg(fn, scatter):
     g = fn(scatter=scatter)
     g['a_new_node'] = lambda position: 2 * position
     assert 'a_new_node' not in fn(scatter=scatter)
+
+
+def test_beamline_two_theta_matches_kernel():
+    da = sc.DataArray(
+        sc.ones(sizes={'detector': 2}),
+        coords={
+            'source_position': sc.vector([0.1, 0.0, -10.0], unit='m'),
+            'sample_position': sc.vector([0.0, 0.0, 0.0], unit='m'),
+            'position': sc.vectors(
+                dims=['detector'], values=[[1.0, 2.0, 3.0], [-0.4, 0.1, 2.0]], unit='m'
+            ),
+        },
+    )
+    from_graph = da.transform_coords('two_theta', graph=beamline.beamline(scatter=True))
+    assert 'L1' not in from_graph.coords
+    assert 'L2' not in from_graph.coords
+    from_kernel = beamline_conv.two_theta(
+        incident_beam=from_graph.coords['incident_beam'],
+        scattered_beam=from_graph.coords['scattered_beam'],
+    )
+    assert sc.allclose(from_graph.coords['two_theta'], from_kernel)
@@ -203,6 +203,15 @@ def test_convert_scattering_conversion_fails_with_noscatter_mode():
         scn.convert(wavelength, origin='wavelength', target='Q', scatter=False)
 
 
+def test_conversion_graph_returns_independent_copies():
+    graph = scn.core.conversion_graph('tof', 'wavelength', True, 'elastic')
+    del graph['wavelength']
+    graph['extra'] = lambda x: x
+    fresh = scn.core.conversion_graph('tof', 'wavelength', True, 'elastic')
+    assert 'wavelength' in fresh
+    assert 'extra' not in fresh
+
+
 @pytest.mark.parametrize('target', ('incident_beam', 'scattered_beam'))
 def test_convert_beams(target):
     def check_positions(data):
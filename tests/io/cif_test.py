@@ -438,6 +438,26 @@ x6a
     )
 
 
+def test_write_block_single_loop_semicolon_in_single_line_string():
+    env = sc.array(dims=['x'], values=['water;salt', 'sulfur'])
+    id_ = sc.array(dims=['x'], values=['123', 'x6a'])
+    block = cif.Block(
+        'looped', [cif.Loop({'diffrn.ambient_environment': env, 'diffrn.id': id_})]
+    )
+    res = write_to_str(block)
+    assert (
+        res
+        == '''data_looped
+
+loop_
+_diffrn.ambient_environment
+_diffrn.id
+water;salt 123
+sulfur x6a
+'''
+    )
+
+
 def test_write_block_single_loop_numbers():
     coeff = sc.array(dims=['cal'], values=[3.65, -0.012, 1.2e-5])
     power = sc.array(dims=['cal'], values=[0, 1, 2])
@@ -470,6 +490,25 @@ DIFA 2 1.2e-05
     )
 
 
+def test_write_block_single_loop_numbers_single_precision():
+    x = sc.array(dims=['x'], values=[1.2, -0.5, 3e-7], dtype='float32')
+    n = sc.array(dims=['x'], values=[7, -2, 0], dtype='int32')
+    block = cif.Block('looped', [cif.Loop({'a.x': x, 'a.n': n})])
+    res = write_to_str(block)
+    assert (
+        res
+        == '''data_looped
+
+loop_
+_a.x
+_a.n
+1.2 7
+-0.5 -2
+3e-07 0
+'''
+    )
+
+
 def test_write_block_single_loop_numbers_errors():
     coeff = sc.array(
         dims=['cal'],
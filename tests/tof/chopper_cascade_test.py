@@ -72,6 +72,36 @@ def test_subframe_propagate_by() -> None:
     )
 
 
+def test_propagate_times_broadcasts_time_against_scalar_wavelength() -> None:
+    time = sc.array(dims=['x'], values=[1.0, 2.0], unit='s')
+    wavelength = sc.scalar(1.0, unit='angstrom')
+    distance = sc.scalar(10.0, unit='m')
+    propagated = chopper_cascade.propagate_times(time, wavelength, distance)
+    shift = (distance * wavelength * sc.constants.m_n / sc.constants.h).to(unit='s')
+    assert propagated.dims == ('x',)
+    assert sc.allclose(
+        propagated,
+        time + shift,
+        atol=sc.scalar(0.0, unit='s'),
+        rtol=sc.scalar(1e-12),
+    )
+
+
+def test_propagate_times_keeps_variances_of_time() -> None:
+    time = sc.array(dims=['x'], values=[1.0, 2.0], variances=[0.1, 0.1], unit='s')
+    wavelength = sc.array(dims=['x'], values=[1.0, 2.0], unit='angstrom')
+    distance = sc.scalar(10.0, unit='m')
+    propagated = chopper_cascade.propagate_times(time, wavelength, distance)
+    shift = (distance * wavelength * sc.constants.m_n / sc.constants.h).to(unit='s')
+    assert_identical(sc.variances(propagated), sc.variances(time))
+    assert sc.allclose(
+        sc.values(propagated),
+        sc.values(time) + shift,
+        atol=sc.scalar(0.0, unit='s'),
+        rtol=sc.scalar(1e-12),
+    )
+
+
 def test_subframe_time_is_converted_to_seconds() -> None:
     time = sc.array(dims=['vertex'], values=[0.0, 1.0, 3.0, 2.0], unit='ms')
     wavelength = sc.array(dims=['vertex'], values=[1.0, 1.1, 2.1, 2.0], unit='nm')